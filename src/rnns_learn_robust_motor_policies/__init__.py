@@ -4,10 +4,12 @@ import logging.handlers as loghandlers
 import os
 from pathlib import Path
 
+import jax
 import plotly.io as pio
 
 from rnns_learn_robust_motor_policies.config import (
     CONFIG_DIR_ENV_VAR_NAME,
+    PATHS,
     PLOTLY_CONFIG,
     LOGGING_CONFIG,
 )
@@ -17,6 +19,14 @@ from rnns_learn_robust_motor_policies.config import (
 pio.templates.default = PLOTLY_CONFIG.templates.default
 
 
+# Persist XLA compilations between runs, so that e.g. repeated training runs with the same 
+# model structure do not recompile their step functions; respect the JAX environment variable.
+# User `paths.yml` files are not merged with the defaults, and may lack `jax_cache`.
+_jax_cache_dir = getattr(PATHS, 'jax_cache', None)
+if "JAX_COMPILATION_CACHE_DIR" not in os.environ and _jax_cache_dir is not None:
+    jax.config.update("jax_compilation_cache_dir", str(_jax_cache_dir))
+
+
 # Logging configuration
 logger = logging.getLogger(__package__)
 logger.setLevel(LOGGING_CONFIG.level)
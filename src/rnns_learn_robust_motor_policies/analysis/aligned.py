@@ -1,9 +1,9 @@
 from collections.abc import Callable
-from copy import deepcopy
 from functools import partial
 from types import MappingProxyType
 from typing import ClassVar, Optional, Literal as L
 
+import equinox as eqx
 from equinox import Module
 import jax.numpy as jnp
 import jax.tree as jt
@@ -43,6 +43,7 @@ WHERE_VARS_TO_ALIGN = lambda states, origins: LDict.of('var')(dict(
 ))
 
 
+@eqx.filter_jit
 def get_forward_lateral_vel(
     velocity: Float[Array, "*batch conditions time xy=2"], 
     pos_endpoints: Float[Array, "point=2 conditions xy=2"],
@@ -63,6 +64,28 @@ def get_forward_lateral_vel(
     return project_onto_direction(velocity, direction_vec)
     
 
+def get_direction_basis(
+    direction_vec: Float[Array, "conditions xy=2"],
+) -> Float[Array, "conditions component=2 xy=2"]:
+    """Return the orthonormal basis (parallel, orthogonal) for each of the given directions."""
+    # Normalize the line vector
+    direction_vec_norm = direction_vec / jnp.linalg.norm(direction_vec, axis=-1, keepdims=True)
+    
+    # Rotate by 90 degrees, so that projecting onto it gives the 2D cross product with the direction
+    direction_vec_perp = jnp.stack([-direction_vec_norm[..., 1], direction_vec_norm[..., 0]], axis=-1)
+    
+    return jnp.stack([direction_vec_norm, direction_vec_perp], axis=-2)
+
+
+def _project_onto_basis(
+    var: Float[Array, "*batch conditions time xy=2"],
+    basis: Float[Array, "conditions component=2 xy=2"],
+) -> Float[Array, "*batch conditions time component=2"]:
+    # Both components in a single contraction, rather than a dot product, a cross product, and a stack
+    return jnp.einsum('...cti,cji->...ctj', var, basis)
+
+
+@eqx.filter_jit
 def project_onto_direction(
     var: Float[Array, "*batch conditions time xy=2"],
     direction_vec: Float[Array, "conditions xy=2"],
@@ -76,29 +99,56 @@ def project_onto_direction(
     Returns:
         projected: Projected components (parallel and orthogonal).
     """
-    # Normalize the line vector
-    direction_vec_norm = direction_vec / jnp.linalg.norm(direction_vec, axis=-1, keepdims=True)
-    
-    # Broadcast line_vec_norm to match velocity's shape
-    direction_vec_norm = direction_vec_norm[:, None]  # Shape: (conditions, 1, xy)
-    
-    # Calculate forward velocity (dot product)
-    parallel = jnp.sum(var * direction_vec_norm, axis=-1)
-    
-    # Calculate lateral velocity (cross product)
-    orthogonal = jnp.cross(direction_vec_norm, var)
-    
-    return jnp.stack([parallel, orthogonal], axis=-1)
+    return _project_onto_basis(var, get_direction_basis(direction_vec))
 
 
+@eqx.filter_jit
 def get_aligned_vars(vars, directions): 
     """Get variables from state PyTree, and project them onto respective reach directions for their trials."""
+    basis = get_direction_basis(directions)
     return jt.map(
-        lambda var: project_onto_direction(var, directions),
+        lambda var: _project_onto_basis(var, basis),
         vars,
     )
 
 
+def _get_aligned_states(
+    states: PyTree, 
+    origins: Float[Array, "conditions xy=2"], 
+    directions: Float[Array, "conditions xy=2"], 
+    where_states_to_align: Callable,
+):
+    """Select the variables to align from `states`, and project them onto `directions`."""
+    basis = get_direction_basis(directions)
+    return jt.map(
+        lambda var: _project_onto_basis(var, basis),
+        where_states_to_align(states, origins),
+    )
+
+
+@eqx.filter_jit
+def _get_all_aligned_states(
+    all_states: PyTree[Module, 'T'], 
+    all_origins_directions: PyTree[tuple[Array, Array], 'T'],
+    where_states_to_align: Callable,
+):
+    """Align all the states in a PyTree, in a single compiled call.
+    
+    Compiling the selection (including origin subtraction) together with the projections lets XLA 
+    fuse them, rather than dispatching each elementwise op eagerly for every variable and condition.
+    Unlike stacking the states and using `vmap`, this does not copy them, nor require that they 
+    have the same shapes.
+    """
+    return jt.map(
+        lambda states, origins_directions: _get_aligned_states(
+            states, *origins_directions, where_states_to_align,
+        ),
+        all_states,
+        all_origins_directions,
+        is_leaf=is_module,
+    )
+
+
 def get_reach_origins_directions(task: AbstractTask, models: PyTree[Module], hps: TreeNamespace):
     pos_endpoints = get_pos_endpoints(get_validation_trial_specs(task))
     directions = pos_endpoints[1] - pos_endpoints[0]
@@ -132,31 +182,33 @@ class AlignedVars(AbstractAnalysis):
         data: AnalysisInputData,
         **kwargs,
     ):
-        def _get_aligned_vars(task, models_by_std, states_by_std, hps):
-            
-            def _get_aligned_vars_by_std(states, models):
-                origins, directions = self.origins_directions_func(task, models, hps)
-                return jt.map(
-                    lambda var: project_onto_direction(var, directions),
-                    self.where_states_to_align(states, origins),
-                )
-            
-            return jt.map(
-                _get_aligned_vars_by_std,
-                states_by_std,
+        # Tasks are often shared between leaves of `data.tasks`, so only get their validation 
+        # trials and compute their origins and directions once
+        origins_directions_cache = {}
+        
+        def _get_origins_directions(task, models, hps):
+            #! Assume origins and directions depend only on the task and hps, and not on the models
+            cache_key = (id(task), id(hps))
+            if cache_key not in origins_directions_cache:
+                origins_directions_cache[cache_key] = self.origins_directions_func(task, models, hps)
+            return origins_directions_cache[cache_key]
+        
+        all_origins_directions = jt.map(
+            lambda task, models_by_std, hps: jt.map(
+                lambda models: _get_origins_directions(task, models, hps),
                 models_by_std,
                 is_leaf=is_module,
-            )
-
-        result = jt.map(
-            _get_aligned_vars,
+            ),
             data.tasks,
             data.models,
-            data.states,
             data.hps,
             is_leaf=is_module,
         )
 
+        result = _get_all_aligned_states(
+            data.states, all_origins_directions, self.where_states_to_align,
+        )
+
         return result
         
         
@@ -202,15 +254,18 @@ class AlignedEffectorTrajectories(AbstractAnalysis):
         colorscales,
         **kwargs,
     ):
-        fig_params = deepcopy(self.fig_params)
+        # Shallow copy; only top-level entries are replaced, so there is no need to `deepcopy`
+        fig_params = dict(self.fig_params)
 
-        if fig_params.legend_title is None and self.colorscale_key is not None:
-            fig_params.legend_title = get_label_str(self.colorscale_key)
+        if self.fig_params.legend_title is None and self.colorscale_key is not None:
+            fig_params['legend_title'] = get_label_str(self.colorscale_key)
             
-        try:
-            fig_params.legend_labels = flat_key_to_where_func(self.colorscale_key)(hps_common)
-        except:
-            pass
+        if self.colorscale_key is not None:
+            try:
+                fig_params['legend_labels'] = flat_key_to_where_func(self.colorscale_key)(hps_common)
+            except AttributeError:
+                # The colorscale key does not refer to a hyperparameter (e.g. "reach_condition")
+                pass
 
         figs = jt.map(
             partial(
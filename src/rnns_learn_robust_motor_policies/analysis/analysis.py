@@ -21,11 +21,11 @@ from jax_cookbook import is_type, is_none, vmap_multi, natural_to_sequential_axe
 import jax_cookbook.tree as jtree
 
 from rnns_learn_robust_motor_policies.config.config import STRINGS
-from rnns_learn_robust_motor_policies.database import EvaluationRecord, add_evaluation_figure, savefig
+from rnns_learn_robust_motor_policies.database import EvaluationRecord, add_evaluation_figure, savefig, update_table_schema
 from rnns_learn_robust_motor_policies.tree_utils import move_ldict_level_above, subdict, tree_level_labels, ldict_level_to_top
 from rnns_learn_robust_motor_policies.misc import camel_to_snake, get_dataclass_fields, get_md5_hexdigest, get_name_of_callable, is_json_serializable
 from rnns_learn_robust_motor_policies.plot_utils import figs_flatten_with_paths, get_label_str
-from rnns_learn_robust_motor_policies.types import LDict, TreeNamespace
+from rnns_learn_robust_motor_policies.types import YAML_DUMPER, LDict, TreeNamespace
 
 
 if TYPE_CHECKING:
@@ -40,7 +40,8 @@ logger = logging.getLogger(__name__)
 # Define a string representer for objects PyYAML doesn't know how to handle
 def represent_undefined(dumper, data):
     return dumper.represent_scalar('tag:yaml.org,2002:str', str(data))
-yaml.add_representer(object, represent_undefined)
+for _dumper in {yaml.Dumper, YAML_DUMPER}:
+    yaml.add_representer(object, represent_undefined, Dumper=_dumper)
 
 
 class AnalysisInputData(Module):
@@ -649,12 +650,15 @@ class AbstractAnalysis(Module, strict=False):
 
         ops_params_dict, ops_filename_str = self._extract_ops_info()
         
-        for i, (path, fig) in enumerate(figs_with_paths_flat):
+        # Include fields from this instance, but only if they are JSON serializable
+        field_params = self._json_serializable_field_params
+        
+        analysis_name = camel_to_snake(self.name)
+        
+        all_params = []
+        for path, fig in figs_with_paths_flat:
             path_params = dict(zip(param_keys, tuple(jtree.node_key_to_value(p) for p in path)))
             
-            # Include fields from this instance, but only if they are JSON serializable
-            field_params = {k: v for k, v in self._field_params.items() if is_json_serializable(v)}
-            
             params = dict(
                 **path_params,  # Inferred from the structure of the figs PyTree
                 **field_params,  # From the fields of the analysis subclass instance
@@ -669,30 +673,58 @@ class AbstractAnalysis(Module, strict=False):
 
             if ops_params_dict:
                 params['ops'] = ops_params_dict
+                
+            all_params.append(params)
             
-            fig_record = add_evaluation_figure(
-                db_session, 
-                eval_info, 
-                fig, 
-                camel_to_snake(self.name), 
-                model_records=model_info, 
-                **params,
-            )
+        # Add any new columns for all the figures at once, rather than once per figure; 
+        # this also avoids altering the table while the batch of records is uncommitted
+        update_table_schema(
+            db_session.bind,
+            STRINGS.db_table_names.figures,
+            {k: v for params in all_params for k, v in params.items()},
+            all_json=True,
+        )
+        
+        # Commit all the figure records together; if saving any figure fails, roll back the 
+        # records added so far, so the session is left usable and no partial batch is committed
+        try:
+            for i, ((path, fig), params) in enumerate(zip(figs_with_paths_flat, all_params)):
+                fig_record = add_evaluation_figure(
+                    db_session, 
+                    eval_info, 
+                    fig, 
+                    analysis_name, 
+                    model_records=model_info, 
+                    update_schema=False,
+                    commit=False,
+                    **params,
+                )
             
-            # Additionally dump to specified path if provided
-            if dump_path is not None:                                
-                # Create a unique filename using class name and hash
-                filename = f"{self.name}_{self.md5_str}_{i}"
+                # Additionally dump to specified path if provided
+                if dump_path is not None:                                
+                    # Create a unique filename using class name and hash
+                    filename = f"{self.name}_{self.md5_str}_{i}"
 
-                savefig(fig, filename, dump_path, dump_formats, metadata=params)
+                    savefig(fig, filename, dump_path, dump_formats, metadata=params)
                 
-                # Save parameters as YAML
-                params_path = dump_path / f"{filename}.yaml"
-                try:    
-                    with open(params_path, 'w') as f:
-                        yaml.dump(params, f, default_flow_style=False, sort_keys=False)
-                except Exception as e:
-                    logger.error(f"Error saving fig dump parameters to {params_path}: {e}", exc_info=True)
+                    # Save parameters as YAML
+                    params_path = dump_path / f"{filename}.yaml"
+                    try:    
+                        with open(params_path, 'w') as f:
+                            yaml.dump(
+                                params, f, Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=False,
+                            )
+                    except Exception as e:
+                        logger.error(f"Error saving fig dump parameters to {params_path}: {e}", exc_info=True)
+        except Exception:
+            db_session.rollback()
+            logger.error(
+                f"Error saving figures for {self.name}; rolled back their database records", 
+                exc_info=True,
+            )
+            raise
+        else:
+            db_session.commit()
 
     @property
     def _all_ops(self) -> tuple: 
@@ -1339,6 +1371,10 @@ class AbstractAnalysis(Module, strict=False):
             include_internal=False,
         )
 
+    @cached_property
+    def _json_serializable_field_params(self) -> Dict[str, Any]:
+        return {k: v for k, v in self._field_params.items() if is_json_serializable(v)}
+
     @cached_property
     def _non_default_field_params(self) -> Dict[str, Any]:
         """
@@ -1,9 +1,11 @@
 from collections.abc import Callable, Sequence
+
 import equinox as eqx
 from feedbax.intervene import CurlField, FixedField
+import jax
 import jax.numpy as jnp
 
-from rnns_learn_robust_motor_policies.analysis.state_utils import vmap_eval_ensemble
+from rnns_learn_robust_motor_policies.analysis.state_utils import eval_ensemble_repeats, get_eval_batch_size
 from rnns_learn_robust_motor_policies.types import TreeNamespace
 import jax.tree as jt
 
@@ -27,13 +29,18 @@ def orthogonal_field(trial_spec, _, key):
     return jnp.array([-direction_vec[1], direction_vec[0]])
 
 
+# Cast `scale` to an array so that it is traced rather than static when the task is passed through 
+# `eqx.filter_jit` (e.g. `vmap_eval_ensemble`); otherwise each amplitude would trigger a recompilation.
+# `schedule_intervenor` also places this intervenor in the models, where the unbatched 0-d array is 
+# safe: model intervenors already hold non-vmapped arrays, which is why `_get_eval_ensemble` and 
+# `take_replicate` exclude `AbstractIntervenor` leaves from the replicate axis
 PLANT_PERT_FUNCS = {
     'curl': lambda scale: CurlField.with_params(
         #! amplitude=amplitude,
-        scale=scale,
+        scale=jnp.asarray(scale, dtype=float),
     ),
     'constant': lambda scale: FixedField.with_params(
-        scale=scale,
+        scale=jnp.asarray(scale, dtype=float),
         field=orthogonal_field,
     ),
 }
@@ -54,23 +61,36 @@ def get_pert_amp_vmap_eval_func(
 ):
     """Returns a function for evaluating models across a range of perturbation amplitudes.
     
+    If the optional hyperparameter `pert_amp_batch_size` is set, the returned function evaluates 
+    that many amplitudes at a time with `jax.lax.map`, rather than vmapping over all of them at 
+    once; this bounds peak memory for large ensembles.
+    
     Args:
         where_pert_amps_in_hps: Callable that selects the sequence of amplitudes from the tree of hyperparameters.
         intervenor_label: The same argument passed to `schedule_intervenor` when setting up the task+models, which 
             identifies which intervention to scale by the vmap argument.
     """
     
-    def eval_func(key_eval, hps, models, task):
-        """Vmap over impulse amplitude."""
-
-        states = eqx.filter_vmap(
-            lambda amplitude: vmap_eval_ensemble(
-                key_eval,
-                hps,
-                models,
-                task_with_pert_amp(task, amplitude, intervenor_label),
-            ),
-        )(jnp.array(where_pert_amps_in_hps(hps)))
+    @eqx.filter_jit
+    def _eval_pert_amps(key_eval, eval_n, eval_batch_size, batch_size, models, task, pert_amps):
+        """Evaluate the models on the task, for each of `pert_amps`.
+        
+        If `batch_size` is given, the amplitudes are evaluated with `jax.lax.map`, which requires 
+        every leaf of the evaluated states to be an array.
+        """
+        eval_amp = lambda amplitude: eval_ensemble_repeats(
+            key_eval,
+            eval_n,
+            models,
+            task_with_pert_amp(task, amplitude, intervenor_label),
+            eval_batch_size,
+        )
+        
+        if batch_size is None:
+            states = eqx.filter_vmap(eval_amp)(pert_amps)
+        else:
+            # Vmaps within each batch of amplitudes, and loops over the batches
+            states = jax.lax.map(eval_amp, pert_amps, batch_size=batch_size)
 
         # I am not sure why this moveaxis is necessary. 
         # I tried using `out_axes=2` (with or without `in_axes=0`) and 
@@ -80,5 +100,21 @@ def get_pert_amp_vmap_eval_func(
             lambda arr: jnp.moveaxis(arr, 0, 2),
             states,
         )
+    
+    def eval_func(key_eval, hps, models, task):
+        """Vmap over impulse amplitude."""
+        # Pass the amplitudes as an array so they are traced, and only the hyperparameters the 
+        # evaluation needs; any other hyperparameter would be static, and so part of the compilation 
+        # cache key
+        return _eval_pert_amps(
+            key_eval, 
+            hps.eval_n, 
+            get_eval_batch_size(hps), 
+            # Declared in the analysis configs, but user config overrides may predate it
+            getattr(hps, 'pert_amp_batch_size', None),
+            models, 
+            task, 
+            jnp.asarray(where_pert_amps_in_hps(hps), dtype=float),
+        )
 
     return eval_func
@@ -331,6 +331,12 @@ def run_analysis_module(
             loaded_from_pickle = True
         except Exception as e:
             logger.error(f"Failed to load pickled states: {e}")
+            # e.g. pickles written before `LDict` gained `__slots__` can no longer be unpickled
+            logger.warning(
+                f"The cached states at {states_pickle_path} are invalid, possibly because they were "
+                "pickled by an older version of this package; they will be recomputed and overwritten, "
+                "which may take a while."
+            )
             logger.info("Computing states from scratch instead...")
             states = _compute_states_and_log_memory_estimate()
     else:
@@ -134,7 +134,7 @@ def setup_eval_tasks_and_models(task_base, models_base, hps):
     )
     
     impulse_amplitudes = jt.map(
-        lambda max_amp: jnp.linspace(0, max_amp, hps.pert.n_amps + 1)[1:],
+        lambda max_amp: jnp.linspace(max_amp / hps.pert.n_amps, max_amp, hps.pert.n_amps),
         LDict.of("pert__var").from_ns(hps.pert.amp_max),
     )
 
@@ -14,7 +14,7 @@ import jax_cookbook.tree as jtree
 
 from rnns_learn_robust_motor_policies.analysis.analysis import AbstractAnalysis, AnalysisDependenciesType, AnalysisInputData, DefaultFigParamNamespace, FigParamNamespace
 from rnns_learn_robust_motor_policies.analysis.state_utils import angle_between_vectors, vmap_eval_ensemble
-from rnns_learn_robust_motor_policies.analysis.state_utils import get_constant_task_input_fn
+from rnns_learn_robust_motor_policies.misc import get_constant_input_fn
 from rnns_learn_robust_motor_policies.types import LDict
 
 
@@ -33,9 +33,9 @@ def setup_eval_tasks_and_models(task_base, models_base, hps):
     task_by_context = LDict.of("context_input")({
         context_input: task_base.add_input(
             name="context",
-            input_fn=get_constant_task_input_fn(
+            input_fn=get_constant_input_fn(
                 context_input, 
-                hps.model.n_steps - 1, 
+                hps.model.n_steps, 
                 task_base.n_validation_trials,
             ),
         )
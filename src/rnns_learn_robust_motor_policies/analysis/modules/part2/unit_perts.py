@@ -28,7 +28,8 @@ from rnns_learn_robust_motor_policies.analysis.measures import Measures
 from rnns_learn_robust_motor_policies.analysis.network import UnitPreferences
 from rnns_learn_robust_motor_policies.analysis.profiles import Profiles
 from rnns_learn_robust_motor_policies.analysis.regression import Regression
-from rnns_learn_robust_motor_policies.analysis.state_utils import get_best_replicate, get_constant_task_input_fn, get_segment_trials_func, get_symmetric_accel_decel_epochs, vmap_eval_ensemble
+from rnns_learn_robust_motor_policies.analysis.state_utils import get_best_replicate, get_segment_trials_func, get_symmetric_accel_decel_epochs, vmap_eval_ensemble
+from rnns_learn_robust_motor_policies.misc import get_constant_input_fn
 from rnns_learn_robust_motor_policies.colors import ColorscaleSpec
 from rnns_learn_robust_motor_policies.config.config import PLOTLY_CONFIG
 from rnns_learn_robust_motor_policies.constants import POS_ENDPOINTS_ALIGNED
@@ -134,9 +135,9 @@ def setup_eval_tasks_and_models(task_base, models_base, hps):
         context_input: jt.map(
             lambda task: task.add_input(
                 name="context",
-                input_fn=get_constant_task_input_fn(
+                input_fn=get_constant_input_fn(
                     context_input, 
-                    hps.model.n_steps - 1, 
+                    hps.model.n_steps, 
                     task.n_validation_trials,
                 ),
             ),
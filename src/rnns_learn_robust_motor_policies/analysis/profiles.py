@@ -10,7 +10,6 @@ import plotly.graph_objects as go
 
 import feedbax.plotly as fbp
 from jax_cookbook import is_type
-import jax_cookbook.tree as jtree
 
 from rnns_learn_robust_motor_policies.analysis.aligned import AlignedVars
 from rnns_learn_robust_motor_policies.analysis.analysis import AbstractAnalysis, AnalysisDependenciesType, AnalysisInputData, DefaultFigParamNamespace, FigParamNamespace
@@ -57,26 +56,14 @@ class Profiles(AbstractAnalysis):
         hps_common,
         **kwargs,
     ):
-        def _get_fig(fig_data, i, coord_label, var_key, colors):      
-            if self.var_labels is not None:
-                var_label = self.var_labels[var_key]
-            else:
-                var_label = var_key
-                
+        def _get_fig(fig_data, i, coord_label, var_label, legend_title, colors):      
             if coord_label:
                 label = f"{coord_label} {var_label}"
             else:
                 label = var_label
-                
-            if isinstance(fig_data, LDict):            
-                colors = list(colors[fig_data.label].dark.values())
-                legend_title = get_label_str(fig_data.label)
-            else:
-                colors = None 
-                legend_title = None
 
             return fbp.profiles(
-                jtree.take(fig_data, i, -1),
+                jt.map(lambda arr: arr[i], fig_data),
                 varname=label.capitalize(),
                 legend_title=legend_title,
                 hline=dict(y=0, line_color="grey"),
@@ -87,11 +74,29 @@ class Profiles(AbstractAnalysis):
             )
             
         def _get_figs_by_coord(var_key, var_data):
+            # The labels and colors are the same for all the coordinates of a variable
+            if self.var_labels is not None:
+                var_label = self.var_labels[var_key]
+            else:
+                var_label = var_key
+                
+            if isinstance(var_data, LDict):            
+                var_colors = list(colors[var_data.label].dark.values())
+                legend_title = get_label_str(var_data.label)
+            else:
+                var_colors = None 
+                legend_title = None
+            
+            # Transfer to host and move the coordinate axis to the front once per variable, so that 
+            # each coordinate's figure gets a view rather than a fresh copy of the array
+            var_data = jt.map(lambda arr: np.moveaxis(np.asarray(arr), -1, 0), var_data)
             if self.coord_labels is None:
-                return _get_fig(var_data, 0, "", var_key, colors)
+                return _get_fig(var_data, 0, "", var_label, legend_title, var_colors)
             else:
                 return LDict.of("coord")({
-                    coord_label: _get_fig(var_data, coord_idx, coord_label, var_key, colors)
+                    coord_label: _get_fig(
+                        var_data, coord_idx, coord_label, var_label, legend_title, var_colors,
+                    )
                     for coord_idx, coord_label in enumerate(self.coord_labels)
                 })
             
@@ -2,9 +2,11 @@ from collections.abc import Callable
 from types import MappingProxyType
 from typing import ClassVar, Optional
 import equinox as eqx
+import jax
 import jax.numpy as jnp 
 import jax.random as jr
 import jax.tree as jt
+import jax.tree_util as jtu
 from jaxtyping import Array, Float, PRNGKeyArray
 
 from feedbax.intervene import AbstractIntervenor
@@ -25,6 +27,7 @@ def angle_between_vectors(v2, v1):
     )   
 
 
+@eqx.filter_jit
 def get_lateral_distance(
     pos: Float[Array, "*batch conditions time xy=2"], 
     pos_endpoints: Float[Array, "point=2 conditions xy=2"],
@@ -46,13 +49,17 @@ def get_lateral_distance(
 
     # Calculate the cross product between the line vector and the point vector
     # This is the area of the parallelogram they form.
-    cross_product = jnp.cross(direction_vec[..., None, :], point_vec)
+    direction_vec = direction_vec[..., None, :]
+    cross_product = (
+        direction_vec[..., 0] * point_vec[..., 1] 
+        - direction_vec[..., 1] * point_vec[..., 0]
+    )
     
     # Obtain the parallelogram heights (i.e. the lateral distances) by dividing 
     # by the length of the line vectors.
     line_length = jnp.linalg.norm(direction_vec, axis=-1)
     # lateral_dist = jnp.abs(cross_product) / line_length
-    lateral_dist = cross_product / line_length[..., None]
+    lateral_dist = cross_product / line_length
 
     return lateral_dist
 
@@ -61,7 +68,7 @@ def get_pos_endpoints(trial_specs):
     """Given a set of `SimpleReaches` trial specifications, return the stacked start and end positions."""
     return jnp.stack([
         trial_specs.inits['mechanics.effector'].pos, 
-        jnp.take(trial_specs.targets['mechanics.effector.pos'].value, -1, axis=-2),
+        trial_specs.targets['mechanics.effector.pos'].value[..., -1, :],
     ], 
     axis=0,
 )
@@ -79,34 +86,64 @@ def _get_eval_ensemble(models, task: AbstractTask):
     return eval_ensemble
 
     
-@eqx.filter_jit
 def vmap_eval_ensemble(
     key: PRNGKeyArray, 
     hps: TreeNamespace, 
     models: eqx.Module, 
     task: AbstractTask,
 ):
-    """Evaluate an ensemble of models on `n` random repeats of a task's validation set."""
-    return eqx.filter_vmap(_get_eval_ensemble(models, task))(
-        jr.split(key, hps.eval_n)
-    )
+    """Evaluate an ensemble of models on `hps.eval_n` random repeats of a task's validation set.
+    
+    If the optional hyperparameter `eval_batch_size` is set, evaluate that many repeats at a time 
+    with `jax.lax.map`, rather than vmapping over all `hps.eval_n` of them at once; this bounds 
+    peak memory for large `eval_n`.
+    """
+    # Only pass the hyperparameters the evaluation needs to the jitted function; non-array leaves of 
+    # `hps` (e.g. a per-leaf `context_input`) would otherwise be static, and force recompilation
+    return eval_ensemble_repeats(key, hps.eval_n, models, task, get_eval_batch_size(hps))
 
 
-def get_constant_task_input_fn(x, n_steps, n_trials):
-    return lambda trial_spec, key: (
-        jnp.full((n_trials, n_steps), x, dtype=float)
-    )
+def get_eval_batch_size(hps: TreeNamespace) -> Optional[int]:
+    """Return the number of evaluation repeats to vmap at once, if the hyperparameters limit it."""
+    # Analysis configs declare `eval_batch_size`; others (e.g. post-training evaluation) may not
+    return getattr(hps, 'eval_batch_size', None)
 
 
-def get_step_task_input_fn(x1, x2, step_step, n_steps, n_trials):
-    def input_func(trial_spec, key):
-        # Create array of x1 values
-        inputs = jnp.full((n_trials, n_steps), x1, dtype=float)
-        inputs = inputs.at[:, step_step:].set(x2)
+@eqx.filter_jit
+def eval_ensemble_repeats(
+    key: PRNGKeyArray, 
+    n: int, 
+    models: eqx.Module, 
+    task: AbstractTask,
+    batch_size: Optional[int] = None,
+):
+    """Evaluate an ensemble of models on `n` random repeats of a task's validation set."""
+    keys = jr.split(key, n)
+    if batch_size is None:
+        return eqx.filter_vmap(_get_eval_ensemble(models, task))(keys)
+    else:
+        #! Assume the evaluated states contain only arrays, as `lax.map` requires
+        return jax.lax.map(_get_eval_ensemble(models, task), keys, batch_size=batch_size)
 
-        return inputs
 
-    return input_func
+def _step_input(x1, x2, step_step: int, n_steps: int, n_trials: int, trial_spec, key):
+    # x1 before `step_step`, and x2 from then on; a select rather than a fill and scatter
+    inputs = jnp.where(jnp.arange(n_steps) >= step_step, x2, x1)
+
+    return jnp.broadcast_to(inputs, (n_trials, n_steps))
+
+
+def get_step_task_input_fn(x1, x2, step_step, n_steps, n_trials):
+    # As with `misc.get_constant_input_fn`, the input values are array leaves of the task rather than 
+    # constants closed over by a function, so tasks which only differ in them can share a trace
+    return jtu.Partial(
+        _step_input, 
+        jnp.asarray(x1, dtype=float), 
+        jnp.asarray(x2, dtype=float), 
+        step_step, 
+        n_steps, 
+        n_trials,
+    )
 
 def _get_replicate_idxs_func(replicate_info, key):
     def _replicate_idxs_func(std):
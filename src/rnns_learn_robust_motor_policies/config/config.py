@@ -1,3 +1,5 @@
+from copy import deepcopy
+from functools import cache
 from importlib import resources
 import logging
 import os
@@ -16,6 +18,9 @@ logger = logging.getLogger(__name__)
 
 CONFIG_DIR_ENV_VAR_NAME = 'RLRMP_CONFIG_DIR'
 
+# Use the libyaml-based loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 def setup_paths(paths_ns: TreeNamespace):
     base_path = Path(paths_ns.base)
 
@@ -53,7 +58,7 @@ def load_config(name: str, config_type: Optional[Literal['training', 'analysis']
         subpath = '/'.join(name_parts[:-1])
         try:
             with open(user_config_dir / subpath / f'{name}.yml') as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=YAML_LOADER)
         except:  
             logger.info(f'Config file {f"{subpath}/{config_name}.yml"} not found in user config directory; using default.')
     
@@ -65,8 +70,14 @@ def load_config(name: str, config_type: Optional[Literal['training', 'analysis']
     subpackage_name = '.'.join([subpackage_name, *name_parts[:-1]])
     
     # Otherwise, load the default
-    with resources.open_text(subpackage_name, f'{config_name}.yml') as f:
-        return yaml.safe_load(f)
+    return deepcopy(_load_config_resource(subpackage_name, f'{config_name}.yml'))
+
+
+@cache
+def _load_config_resource(subpackage_name: str, filename: str) -> dict:
+    """Parse a default config resource; these are packaged with the project, so parse each only once."""
+    with resources.open_text(subpackage_name, filename) as f:
+        return yaml.load(f, Loader=YAML_LOADER)
 
 
 def load_config_as_ns(
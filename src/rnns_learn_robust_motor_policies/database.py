@@ -34,6 +34,7 @@ from sqlalchemy import (
     String,
     Table, 
     create_engine, 
+    event,
     inspect,
     or_,
 )
@@ -213,23 +214,43 @@ def update_table_schema(engine, table_name: str, columns: Dict[str, Any], all_js
     inspector = inspect(engine)
     existing_columns = {col['name'] for col in inspector.get_columns(table_name)}
     
-    # Create Alembic context
-    context = MigrationContext.configure(engine.connect())
-    op = Operations(context)
+    new_columns = [
+        Column(key, JSON() if all_json else get_sql_type(value), nullable=True)
+        for key, value in columns.items()
+        if key not in existing_columns
+    ]
+    
+    # Usually there are no new columns, in which case the schema doesn't need to be touched
+    if not new_columns:
+        return
+    
     model_class = TABLE_NAME_TO_MODEL[table_name]
     
-    # Add only new columns using Alembic operations
-    for key, value in columns.items():
-        if key not in existing_columns:
-            column_type = JSON() if all_json else get_sql_type(value)
-            column = Column(key, column_type, nullable=True)
-            setattr(model_class, key, column)
+    # Create Alembic context, on a single connection which is committed and closed 
+    # once all the new columns are added
+    with engine.begin() as conn:
+        op = Operations(MigrationContext.configure(conn))
+    
+        # Add only new columns using Alembic operations
+        for column in new_columns:
+            setattr(model_class, column.name, column)
             op.add_column(table_name, column)
             
     RecordBase.metadata.clear()             # Clear SQLAlchemy's cached schema
     RecordBase.metadata.create_all(engine)  # Recreate tables with new schema
             
 
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use write-ahead logging, so that commits don't each wait on a full sync of the database file."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    # In WAL mode, this is still safe against corruption; only the most recent commits could be 
+    # lost, if the OS crashes
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
 def init_db_session(db_path: str = "sqlite:///models.db"):
     """Opens a session to an SQLite database.
     
@@ -252,6 +273,8 @@ def init_db_session(db_path: str = "sqlite:///models.db"):
         so I could explicitly add all of them to the model classes.
     """
     engine = create_engine(db_path)
+    if engine.dialect.name == 'sqlite':
+        event.listen(engine, 'connect', _set_sqlite_pragmas)
     RecordBase.metadata.create_all(engine)
     
     # Dynamically add missing columns to the table record classes
@@ -284,11 +307,9 @@ def get_db_session(name: str = "main"):
     
 def hash_file(path: Path) -> str:
     """Generate MD5 hash of file."""
-    md5 = hashlib.md5()
+    # Keep MD5 so that hashes (and thus file names) stay consistent with existing records
     with open(path, 'rb') as f:
-        for chunk in iter(lambda: f.read(4096), b''):
-            md5.update(chunk)
-    return md5.hexdigest()
+        return hashlib.file_digest(f, 'md5').hexdigest()
 
 
 def generate_temp_path(directory: Path, prefix: str = "temp_", suffix: str = ".eqx") -> Path:
@@ -830,6 +851,8 @@ def add_evaluation_figure(
     identifier: str,
     model_records: PyTree[ModelRecord] = None,
     save_formats: Optional[str | Sequence[str]] = "png",
+    update_schema: bool = True,
+    commit: bool = True,
     **parameters: Any,
 ) -> FigureRecord:
     """Save figure and create database record with dynamic parameters.
@@ -840,6 +863,10 @@ def add_evaluation_figure(
         figure: Plotly or matplotlib figure to save
         identifier: Unique label for this type of figure
         save_formats: The image types to save. 
+        update_schema: Whether to add columns to the figures table for any new parameters. 
+            Pass `False` if the caller has already done this, e.g. for a batch of figures.
+        commit: Whether to commit the session after adding the record. If `False`, the 
+            session is only flushed, and the caller is responsible for committing.
         **parameters: Additional parameters that distinguish the figure
     """
     parameters = arrays_to_lists(parameters)
@@ -872,12 +899,13 @@ def add_evaluation_figure(
     savefig(figure, figure_hash, eval_record.figure_dir, save_formats)
     
     # Update schema with new parameters
-    update_table_schema(
-        session.bind, 
-        STRINGS.db_table_names.figures, 
-        parameters,
-        all_json=True,
-    )
+    if update_schema:
+        update_table_schema(
+            session.bind, 
+            STRINGS.db_table_names.figures, 
+            parameters,
+            all_json=True,
+        )
     
     if model_records is None:
         model_hashes = None
@@ -901,11 +929,18 @@ def add_evaluation_figure(
     existing_record = get_record(session, FigureRecord, hash=figure_hash)
     if existing_record is not None:
         session.delete(existing_record)
-        session.commit()
+        # Make sure the delete is emitted before the insert of the replacement
+        if commit:
+            session.commit()
+        else:
+            session.flush()
         logger.debug(f"Replacing existing figure record with hash {figure_hash}")
     
     session.add(figure_record)
-    session.commit()
+    if commit:
+        session.commit()
+    else:
+        session.flush()
     return figure_record
 
 
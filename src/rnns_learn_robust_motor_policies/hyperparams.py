@@ -2,6 +2,7 @@
 
 from collections.abc import Callable, Sequence
 from copy import deepcopy
+from functools import cache
 import logging
 from pathlib import Path
 from types import SimpleNamespace
@@ -223,8 +224,12 @@ def take_train_histories_hps(hps: TreeNamespace) -> TreeNamespace:
     )
 
 
+@cache
 def flat_key_to_where_func(key: str, sep: str = STRINGS.hps_level_label_sep) -> Callable:
-    """Convert a flattened hyperparameter key to a where-function."""
+    """Convert a flattened hyperparameter key to a where-function.
+    
+    The result is cached, since the same keys are converted repeatedly when making figures.
+    """
     where_str = key.replace(sep, '.')
     return where_attr_strs_to_func(where_str)
 
@@ -1,3 +1,4 @@
+from collections import deque
 from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from copy import deepcopy
 from dataclasses import fields
@@ -22,6 +23,7 @@ import jax
 import jax.numpy as jnp 
 import jax.random as jr 
 import jax.tree as jt
+import jax.tree_util as jtu
 from jaxtyping import Array, Float, Int
 import numpy as np
 import pandas as pd
@@ -82,9 +84,10 @@ def lohi(x: Iterable):
         return subdict(x, tuple(lohi(tuple(x.keys()))))
     
     elif isinstance(x, Iterator):
-        first = last = next(x)
-        for last in x:
-            pass
+        first = next(x)
+        # Exhaust the iterator in C, keeping only the final item
+        tail = deque(x, maxlen=1)
+        last = tail[0] if tail else first
         
     elif isinstance(x, Sequence):
         first = x[0]
@@ -379,10 +382,17 @@ def is_json_serializable(value):
     return False
 
 
+def _constant_input(x, n_steps: int, n_trials: int, trial_spec, key):
+    # `x` is already a float array (see `get_constant_input_fn`); broadcasting it lets XLA fuse the 
+    # broadcast into the consumer of the input, rather than filling a dense array
+    return jnp.broadcast_to(x, (n_trials, n_steps - 1))
+
+
 def get_constant_input_fn(x, n_steps: int, n_trials: int):
-    return lambda trial_spec, key: (
-        jnp.full((n_trials, n_steps - 1), x, dtype=float)
-    )
+    # As a `Partial`, `x` is an array leaf of the task rather than a constant closed over by a 
+    # lambda; tasks which only differ in `x` can then share a single `eqx.filter_jit` trace,
+    # as long as `x` is not also passed as a static hyperparameter (see `vmap_eval_ensemble`)
+    return jtu.Partial(_constant_input, jnp.asarray(x, dtype=float), n_steps, n_trials)
 
 
 def copy_delattr(obj: Any, *attr_names: str):
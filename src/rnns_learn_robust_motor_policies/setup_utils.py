@@ -97,20 +97,16 @@ def get_latest_matching_file(directory: str, pattern: str) -> Optional[str]:
         OSError: If there's an error reading the directory.
     """
     try:
-        all_files = os.listdir(directory)
+        with os.scandir(directory) as entries:
+            # Only the last filename in sort order is needed, so there's no need to sort them all
+            return max(
+                (entry.name for entry in entries if fnmatch.fnmatch(entry.name, pattern)),
+                default=None,
+            )
     except OSError as e:
         print(f"Error reading directory {directory}: {e}")
         return None
 
-    matching_files = fnmatch.filter(all_files, pattern)
-
-    if not matching_files:
-        return None
-
-    sorted_files = sorted(matching_files, reverse=True)
-
-    return sorted_files[0]
-
 
 def display_model_filechooser(path, filter_pattern='*.eqx',):
     """Display a file chooser interface for the files at `path` whose names satisfy `filter_pattern`.
@@ -1,6 +1,7 @@
 from collections.abc import Mapping, Sequence
-from copy import deepcopy
-from functools import partial
+from concurrent.futures import Future, ThreadPoolExecutor
+from copy import copy
+from functools import cache, partial
 import logging
 from types import NoneType
 from typing import Optional
@@ -131,15 +132,21 @@ def train_pair(
     return trained, train_history_all
 
 
+@cache
+def _attr_strs_to_where_func(strs: tuple[str, ...]):
+    """Return the same where-function for equal attribute strings, so the trainer's trace cache can hit."""
+    return attr_str_tree_to_where_func(list(strs))
+
+
 def where_strs_to_funcs(where_strs: Sequence[str] | dict[int, Sequence[str]]):
     if isinstance(where_strs, Mapping):
         return {
-            i: attr_str_tree_to_where_func(strs) 
+            i: _attr_strs_to_where_func(tuple(strs)) 
             # TODO: Let the user pass a single sequence, instead of a dict of them
             for i, strs in where_strs.items()
         }
     elif isinstance(where_strs, Sequence):
-        return attr_str_tree_to_where_func(where_strs)
+        return _attr_strs_to_where_func(tuple(where_strs))
     else:
         raise ValueError("`where_strs` must be a sequence or dict of sequences")
 
@@ -193,6 +200,30 @@ def train_and_save_models(
     # TODO: Is this correct? Or should we pass the task for the respective training method?
     task_baseline: AbstractTask = jt.leaves(task_model_pairs, is_leaf=is_type(TaskModelPair))[0].task
 
+    def save_and_process_model(trained_model, train_history, hps_train):
+        model_record = save_model_and_add_record(
+            db_session,
+            trained_model,
+            hps_train,
+            train_history=train_history,
+            version_info=version_info,
+        )
+        if postprocess:
+            process_model_post_training(
+                db_session,
+                model_record,
+                n_std_exclude,
+                process_all=True,
+                save_figures=save_figures,
+            )
+        return model_record
+
+    # Save and post-process each model in the background while the next pair trains.
+    #! A single worker, so that the database session is only ever used by one thread at a time
+    io_pool = ThreadPoolExecutor(max_workers=1)
+    # The save of the previous pair, if any
+    pending_saves: list[Future] = []
+
     def train_and_save_pair(pair, hps_train):
         trained_model, train_history = train_pair(
             trainer, 
@@ -209,41 +240,44 @@ def train_and_save_models(
             state_reset_iterations=hps_train.state_reset_iterations,
             # disable_tqdm=True,
         )
-        model_record = save_model_and_add_record(
-            db_session,
-            trained_model,
-            hps_train,
-            train_history=train_history,
-            version_info=version_info,
+        # Wait for the previous pair's save before starting this one, so that an error from saving 
+        # or post-processing is raised after at most one more pair has trained, and not at the end
+        if pending_saves:
+            pending_saves.pop().result()
+        model_record = io_pool.submit(
+            save_and_process_model, trained_model, train_history, hps_train,
         )
-        if postprocess:
-            process_model_post_training(
-                db_session,
-                model_record,
-                n_std_exclude,
-                process_all=True,
-                save_figures=save_figures,
-            )
+        pending_saves.append(model_record)
             
         return trained_model, train_history, model_record
         
-    trained_models, train_histories, model_records = jtree.unzip(jtree.map_tqdm(
-        # TODO: Could return already-trained models instead of None; would need to return `already_trained` bool from `skip_already_trained`
-        lambda pair, hps: train_and_save_pair(pair, hps) if pair is not None else None,
-        task_model_pairs, 
-        all_hps_train,
-        label="Training all pairs",
-        is_leaf=is_type(TaskModelPair, NoneType),
-    ))
+    with io_pool:
+        trained_models, train_histories, model_records = jtree.unzip(jtree.map_tqdm(
+            # TODO: Could return already-trained models instead of None; would need to return `already_trained` bool from `skip_already_trained`
+            lambda pair, hps: train_and_save_pair(pair, hps) if pair is not None else None,
+            task_model_pairs, 
+            all_hps_train,
+            label="Training all pairs",
+            is_leaf=is_type(TaskModelPair, NoneType),
+        ))
+    
+        # Wait for the last save, and collect the records; this also re-raises any error from it
+        model_records = jt.map(
+            lambda future: future.result(), 
+            model_records, 
+            is_leaf=is_type(Future),
+        )
     
     return trained_models, train_histories, model_records
     
 
 def concat_save_iterations(iterations: Array, n_batches_seq: Sequence[int]):
+    # Build the (small) index array on the host, rather than dispatching ops per segment
+    iterations = np.asarray(iterations)
     total_batches = np.cumsum([0] + list(n_batches_seq))
-    return jnp.concatenate([
+    return jnp.asarray(np.concatenate([
         iterations[iterations < n] + total for n, total in zip(n_batches_seq, total_batches)
-    ])
+    ]))
 
 
 def skip_already_trained(
@@ -259,7 +293,8 @@ def skip_already_trained(
     all_hps_train = arrays_to_lists(all_hps_train)
     
     def get_query_hps(hps: TreeNamespace, **kwargs) -> TreeNamespace:
-        hps = deepcopy(hps)
+        # Only top-level attributes are set, so a shallow copy leaves `hps` itself unchanged
+        hps = copy(hps)
         hps.is_path_defunct = False
         for k, v in kwargs.items():
             setattr(hps, k, v)
@@ -328,8 +363,13 @@ def skip_already_trained(
     return task_model_pairs
 
 
+@cache
 def make_delayed_cosine_schedule(init_lr, constant_steps, total_steps, alpha=0.001):
-    """Returns an Optax schedule that starts with constant learning rate, then cosine anneals."""
+    """Returns an Optax schedule that starts with constant learning rate, then cosine anneals.
+    
+    The same schedule function is returned for the same arguments, so that it hashes equally 
+    wherever it ends up as a static part of a jitted computation.
+    """
     constant_schedule = optax.constant_schedule(init_lr)
     
     cosine_schedule = optax.cosine_decay_schedule(
@@ -1,5 +1,7 @@
 from collections.abc import Callable, KeysView, Mapping
+from functools import reduce
 import logging
+from operator import getitem
 from types import SimpleNamespace
 from typing import Any, Optional, TypeVar, Sequence
 
@@ -52,7 +54,11 @@ def dictmerge(*dicts: Mapping) -> Mapping:
         constructor = _get_mapping_constructor(dicts[0])
     else: 
         constructor = dict
-    return constructor({k: v for d in dicts for k, v in d.items()})
+    # Later mappings take precedence
+    merged = {}
+    for d in dicts:
+        merged.update(d)
+    return constructor(merged)
 
 
 # TODO: This exists because I was thinking of generalizing the way that
@@ -68,19 +74,9 @@ def map_kwargs_to_dict(
     """Given a function that takes optional kwargs, evaluate the function over 
     a sequence of values of a single kwarg
     """
-    return dict(zip(
-        values, 
-        map(
-            lambda value: func(**{keyword: value}), 
-            values,
-        )
-    ))
+    return {value: func(**{keyword: value}) for value in values}
 
 
-def falsef(x):
-    return False
-
-    
 def tree_level_labels(
     tree: LDict, 
     sep: Optional[str] = None,
@@ -246,20 +242,22 @@ def ldict_level_keys(tree: PyTree, label: str) -> KeysView:
 #     # TODO: Map over `tree`
 
 
-def tree_level_types(tree: PyTree, is_leaf=falsef) -> list[type]:
+def tree_level_types(tree: PyTree, is_leaf: Optional[Callable] = None) -> list[type]:
     """Given a PyTree, return a PyTree of the types of each node along the path to the first leaf."""
     treedef = jt.structure(tree)
     
     subtreedef = treedef
     types = []
     
-    while any(subtreedef.children()):
+    children = subtreedef.children()
+    while any(children):
         node_data = subtreedef.node_data()
         if node_data is not None:
-            if is_leaf(node_data[0]):
+            if is_leaf is not None and is_leaf(node_data[0]):
                 break
             types.append(node_data[0])
-        subtreedef = subtreedef.children()[0]
+        subtreedef = children[0]
+        children = subtreedef.children()
     
     return types
 
@@ -329,9 +327,13 @@ LT = TypeVar('LT', bound=str)
 def tree_subset_ldict_level(tree: PyTree[LDict[K, V]], keys: Sequence[K], label: str):
     """Maps `subdict` over LabeledDict nodes with a specific label in a PyTree.
     """
-    ldicts, other = eqx.partition(tree, LDict.is_of(label), is_leaf=LDict.is_of(label))
-    ldicts = [subdict(ld, keys) for ld in ldicts if ld is not None]
-    return eqx.combine(ldicts, other)
+    is_ldict = LDict.is_of(label)
+    # Single traversal; other leaves are passed through by reference
+    return jt.map(
+        lambda node: subdict(node, keys) if is_ldict(node) else node,
+        tree,
+        is_leaf=is_ldict,
+    )
     
 
 def flatten_with_paths(tree, is_leaf=None):
@@ -340,9 +342,7 @@ def flatten_with_paths(tree, is_leaf=None):
 
 def index_multi(obj, *idxs):
     """Index zero or more times into a Python object."""
-    if not idxs:
-        return obj
-    return index_multi(obj[idxs[0]], *idxs[1:])
+    return reduce(getitem, idxs, obj)
 
 
 _is_leaf = anyf(is_module, is_type(go.Figure, TreeNamespace))
@@ -372,11 +372,8 @@ def take_replicate(i, tree: PyTree[Array, 'T']) -> PyTree[Array, 'T']:
     # Need to partition since there are non-vmapped *arrays* in the intervenors...
     intervenors, other = eqx.partition(
         tree, 
-        jt.map(
-            lambda x: isinstance(x, AbstractIntervenor), 
-            tree, 
-            is_leaf=is_type(AbstractIntervenor),
-        ),
+        is_type(AbstractIntervenor),
+        is_leaf=is_type(AbstractIntervenor),
     )
     return eqx.combine(intervenors, jtree.take(other, i))
 
@@ -389,11 +386,15 @@ def deep_update(d1, d2):
     # Returns dict(a=dict(b=4, c=3)), not dict(a=dict(b=4)).
     ```
     """
-    for k, v in d2.items():
-        if isinstance(v, dict) and k in d1 and isinstance(d1[k], dict):
-            deep_update(d1[k], v)
-        else:
-            d1[k] = v
+    # Iterate over an explicit stack of (destination, source) pairs, rather than recursing
+    stack = [(d1, d2)]
+    while stack:
+        dst, src = stack.pop()
+        for k, v in src.items():
+            if isinstance(v, dict) and k in dst and isinstance(dst[k], dict):
+                stack.append((dst[k], v))
+            else:
+                dst[k] = v
     return d1
 
 
@@ -2,6 +2,7 @@ from collections import namedtuple
 from collections.abc import Callable, Iterable, Mapping
 from copy import deepcopy
 from enum import Enum
+from functools import cache
 from types import SimpleNamespace
 from typing import Any, Dict, Generic, NamedTuple, Optional, TypeVar, overload
 import equinox as eqx
@@ -62,7 +63,7 @@ def namespace_to_dict(
 
 
 def is_dict_with_int_keys(d: dict) -> bool:
-    return isinstance(d, dict) and len(d) > 0 and all(isinstance(k, int) for k in d.keys())
+    return isinstance(d, dict) and len(d) > 0 and all(isinstance(k, int) for k in d)
 
 
 @jtu.register_pytree_with_keys_class
@@ -80,8 +81,13 @@ class TreeNamespace(SimpleNamespace):
     """
     def tree_flatten_with_keys(self):
         children_with_keys = [(jtu.GetAttrKey(k), v) for k, v in self.__dict__.items()]
-        aux_data = self.__dict__.keys()
+        aux_data = tuple(self.__dict__)
         return children_with_keys, aux_data
+    
+    def tree_flatten(self):
+        # Fast path for operations which don't need key paths, as for `LDict`; the attribute 
+        # names are not cached since, unlike `LDict`, namespaces are mutable
+        return tuple(self.__dict__.values()), tuple(self.__dict__)
 
     @classmethod
     def tree_unflatten(cls, aux_data, children):
@@ -236,9 +242,14 @@ class LDict(Mapping[K, V], Generic[K, V]):
     which columns to store those hyperparameters in, in the DB.
     """
     
+    # No per-instance `__dict__`; `Mapping` and `Generic` define empty slots
+    __slots__ = ('_label', '_data', '_keys')
+    
     def __init__(self, label: str, data: Mapping[K, V]):
         self._label = label
         self._data = dict(data)  
+        # Since the data is immutable, the keys can be stored once as hashable PyTree aux data
+        self._keys = tuple(self._data)
 
     @property
     def label(self) -> str:
@@ -253,6 +264,14 @@ class LDict(Mapping[K, V], Generic[K, V]):
     def __len__(self) -> int:
         return len(self._data)
     
+    def __reduce__(self):
+        # Rebuild through `__init__` rather than restoring each slot separately
+        return (self.__class__, (self._label, self._data))
+    
+    def __contains__(self, key) -> bool:
+        # Skip `Mapping.__contains__`, which goes through `__getitem__` and catches `KeyError`
+        return key in self._data
+    
     # def __repr__(self) -> str:
     #     #! TODO: Proper line breaks when nested
     #     return f"LDict({repr(self.label)}, {self._data})"
@@ -321,7 +340,12 @@ class LDict(Mapping[K, V], Generic[K, V]):
     def tree_flatten_with_keys(self):
         # Avoids `FlattenedIndexKey` appearing in key paths
         children_with_keys = [(jtu.DictKey(k), v) for k, v in self.items()]
-        return children_with_keys, (self._label, self.keys())
+        return children_with_keys, (self._label, self._keys)
+    
+    def tree_flatten(self):
+        # Fast path for operations which don't need key paths (e.g. `jt.map`), 
+        # so that `DictKey` objects aren't constructed on every flatten
+        return tuple(self._data.values()), (self._label, self._keys)
     
     @classmethod
     def tree_unflatten(cls, aux_data, children):
@@ -341,8 +365,12 @@ class LDict(Mapping[K, V], Generic[K, V]):
         return self._data.get(key, default)
 
     @staticmethod
+    @cache
     def of(label: str):
-        """Returns a constructor function for the given label."""
+        """Returns a constructor function for the given label.
+        
+        Constructors are cached, so repeated calls with the same label return the same object.
+        """
         return LDictConstructor(label)
     
     @staticmethod
@@ -416,12 +444,28 @@ class LDictConstructor(Generic[K, V]):
 
 
 # YAML serialisation/deserialisation for LDict objects
+@cache
+def _ldict_tag(label: str) -> str:
+    return f"!LDict:{label}"
+
+
 def _ldict_representer(dumper, data):
     # Store both the label and the dictionary data
     # Format: !LDict:label {key1: value1, key2: value2, ...}
-    return dumper.represent_mapping(f"!LDict:{data.label}", data._data)
+    return dumper.represent_mapping(_ldict_tag(data._label), data._data)
+
+# Use the libyaml-based dumper when PyYAML was built with it
+YAML_DUMPER = getattr(yaml, 'CDumper', yaml.Dumper)
 
-yaml.add_representer(LDict, _ldict_representer)
+# Also register with the safe dumpers, so that `yaml.safe_dump` can serialise LDicts 
+# to match the safe loader constructors below
+for _dumper in {
+    yaml.Dumper, 
+    YAML_DUMPER, 
+    yaml.SafeDumper, 
+    getattr(yaml, 'CSafeDumper', yaml.SafeDumper),
+}:
+    yaml.add_representer(LDict, _ldict_representer, Dumper=_dumper)
 
 def _ldict_multi_constructor(loader, tag_suffix, node):
     # Extract the label from the tag suffix (after the colon)
@@ -429,7 +473,10 @@ def _ldict_multi_constructor(loader, tag_suffix, node):
     mapping = loader.construct_mapping(node)
     return LDict(label, mapping)
 
-yaml.SafeLoader.add_multi_constructor('!LDict:', _ldict_multi_constructor)
+# libyaml's `CSafeLoader` keeps its own constructor registry, separate from `SafeLoader`'s;
+# the config loader uses it when available
+for _loader in {yaml.SafeLoader, getattr(yaml, 'CSafeLoader', yaml.SafeLoader)}:
+    _loader.add_multi_constructor('!LDict:', _ldict_multi_constructor)
     
 
 # class ImpulseAmpTuple(tuple, Generic[K, V]):